@@ -1,7 +1,7 @@
 """Mii file extraction and analysis library"""
 
 from .database import MiiDatabase, MiiDatabaseError
-from .models import Mii
+from .models import Mii, read_creation_datetime
 from .parser import MiiParser
 from .types import MiiType
 
@@ -11,4 +11,5 @@ __all__ = [
     "MiiParser",
     "MiiDatabaseError",
     "MiiType",
+    "read_creation_datetime",
 ]
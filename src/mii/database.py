@@ -1,5 +1,6 @@
 """Mii database reader and manager"""
 
+import mmap
 import platform
 from pathlib import Path
 from typing import Iterator, List, Callable, Optional
@@ -8,6 +9,13 @@ from .models import Mii
 from .parser import MiiParser
 from .types import MiiType
 
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional (install with: pip install mii-lib[speed]);
+    # scanning falls back to pure Python without it
+    numpy = None
+
 
 class MiiDatabaseError(Exception):
     """Exception raised during Mii database operations"""
@@ -45,6 +53,35 @@ def _get_known_database_locations(filename: str) -> List[Path]:
     return locations
 
 
+def _scan_record_offsets(view: memoryview, start: int, end: int, size: int) -> list:
+    """Find the offsets of non-empty records in a mapped database region
+
+    Args:
+        view: Memoryview over the mapped database file
+        start: Offset of the first record slot
+        end: End of the record region (exclusive)
+        size: Size of each record in bytes
+
+    Returns:
+        List of offsets whose record contains at least one non-zero byte
+    """
+    count = (end - start) // size
+    if count <= 0:
+        return []
+
+    if numpy is not None:
+        # Vectorized path: one C-level reduction over all records at once
+        records = numpy.frombuffer(
+            view, dtype=numpy.uint8, count=count * size, offset=start
+        ).reshape(count, size)
+        return [start + int(i) * size for i in numpy.nonzero(records.any(axis=1))[0]]
+
+    # any() short-circuits on the first non-zero byte of each record
+    return [
+        pos for pos in range(start, end - size + 1, size) if any(view[pos : pos + size])
+    ]
+
+
 class MiiDatabase:
     """Reads and manages Miis from a database file"""
 
@@ -86,29 +123,37 @@ class MiiDatabase:
 
     def _load_miis(self) -> None:
         """Load all Miis from the database file into memory"""
-        empty_mii = bytearray(self.mii_type.SIZE)
-
         try:
+            if self.file_path.stat().st_size == 0:
+                return
+
             with open(self.file_path, "rb") as infile:
-                infile.seek(self.mii_type.OFFSET)
-
-                mii_count = 0
-                is_active = True
-
-                while is_active and mii_count < self.mii_type.LIMIT:
-                    mii_data = infile.read(self.mii_type.SIZE)
-
-                    # Stop if we've run out of data
-                    if len(mii_data) < self.mii_type.SIZE:
-                        is_active = False
-                    # Skip empty Miis but continue reading
-                    elif mii_data == empty_mii:
-                        continue
-                    else:
-                        # Parse the Mii data
-                        mii = MiiParser.parse(mii_data, padding=self.mii_type.PADDING)
-                        self._miis.append(mii)
-                        mii_count += 1
+                # Map the database read-only; slicing a memoryview of the map
+                # is zero-copy, so only non-empty records are ever copied out
+                mm = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+
+            # The scan walks the file front to back, so ask the kernel for
+            # aggressive readahead where madvise is available (Python 3.8+,
+            # Unix only)
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            view = memoryview(mm)
+            # Hoist the enum attribute lookups out of the scan entirely
+            size, start, limit, padding = (
+                self.mii_type.SIZE,
+                self.mii_type.OFFSET,
+                self.mii_type.LIMIT,
+                self.mii_type.PADDING,
+            )
+            end = min(start + limit * size, len(mm))
+
+            # Scan for non-empty slots first, then batch-parse just those records
+            records = [
+                bytes(view[pos : pos + size])
+                for pos in _scan_record_offsets(view, start, end, size)
+            ]
+            self._miis.extend(MiiParser.parse_batch(records, padding=padding))
 
         except PermissionError as e:
             raise MiiDatabaseError(
@@ -1,12 +1,40 @@
 """Mii parser for converting raw bytes into Mii dataclass instances"""
 
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Sequence
+
 from .models import Mii
 
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional (install with: pip install mii-lib[speed]);
+    # batch parsing falls back to per-record parsing without it
+    numpy = None
+
+
+# Fixed-offset fields of a Mii record, unpacked in one call: metadata flags
+# (bytes 0-2), Mii name (2-22), Mii ID (24-28) and creator name (54-74)
+_RECORD_STRUCT = struct.Struct(">H20s2x4s26x20s")
+
+# Header-only variant for records too short for the full layout (e.g. 64-byte
+# Wii parade records, whose creator field is cut off by the record size)
+_HEADER_STRUCT = struct.Struct(">H20s2x4s")
+
+
+@lru_cache(maxsize=4096)
+def _parse_file_cached(path_str: str, mtime_ns: int, size: int, padding: int) -> Mii:
+    # mtime_ns and size are part of the key purely to invalidate stale entries
+    with open(path_str, "rb") as f:
+        return MiiParser.parse(f.read(), padding=padding)
+
 
 class MiiParser:
     """Parses raw Mii bytes into Mii dataclass instances"""
 
-    COLORS = [
+    COLORS = (
         "Red",
         "Orange",
         "Yellow",
@@ -19,58 +47,36 @@ class MiiParser:
         "Brown",
         "White",
         "Black",
-    ]
+    )
 
     @classmethod
-    def _read_string(cls, data: bytes, offset: int, length: int) -> str:
-        """Read UTF-16BE string from the data"""
-        string_data = data[offset : offset + length]
-        # Find the first null terminator (0x0000 in UTF-16BE)
-        null_pos = string_data.find(b"\x00\x00")
-        if null_pos != -1:
-            # Ensure we align to 2-byte boundaries for UTF-16
-            if null_pos % 2 != 0:
-                null_pos -= 1
-            string_data = string_data[: null_pos + 2]
+    def _decode_string(cls, string_data: bytes) -> str:
+        """Decode a UTF-16BE string field up to its null terminator"""
+        # Scan aligned 2-byte code units for the 0x0000 terminator; find()
+        # could match at odd offsets and then needed a realignment fixup
+        for pos in range(0, len(string_data) - 1, 2):
+            if string_data[pos] == 0 and string_data[pos + 1] == 0:
+                string_data = string_data[:pos]
+                break
 
         # Convert from UTF-16BE and remove null terminators
         return string_data.decode("utf-16be").rstrip("\x00")
 
     @classmethod
-    def _read_mii_name(cls, data: bytes) -> str:
-        """Read Mii name starting at offset 2"""
-        return cls._read_string(data, 2, 20)
-
-    @classmethod
-    def _read_creator_name(cls, data: bytes) -> str:
-        """Read creator name starting at offset 54"""
-        return cls._read_string(data, 54, 20)
-
-    @classmethod
-    def _read_mii_metadata(cls, data: bytes) -> tuple:
-        """Read and parse Mii metadata from first 2 bytes
+    def _unpack_flags(cls, value: int) -> tuple:
+        """Unpack Mii metadata fields from the 16-bit flags value
 
         Returns:
             Tuple of (is_girl, birth_month, birth_day, favorite_color_index, is_favorite)
         """
-        # Read first 2 bytes and convert to binary string
-        metadata_bytes = data[0:2]
-        binary_str = "".join(format(b, "08b") for b in metadata_bytes)
-
-        # Extract metadata fields
-        is_girl = int(binary_str[1], 2)
-        birth_month = int(binary_str[2:6], 2)
-        birth_day = int(binary_str[6:11], 2)
-        favorite_color_index = int(binary_str[11:15], 2)
-        is_favorite = int(binary_str[15], 2)
+        is_girl = (value >> 14) & 0x1
+        birth_month = (value >> 10) & 0xF
+        birth_day = (value >> 5) & 0x1F
+        favorite_color_index = (value >> 1) & 0xF
+        is_favorite = value & 0x1
 
         return (is_girl, birth_month, birth_day, favorite_color_index, is_favorite)
 
-    @classmethod
-    def _read_mii_id(cls, data: bytes) -> bytes:
-        """Read 4-byte Mii ID starting at offset 24"""
-        return data[24:28]
-
     @classmethod
     def _get_color_name(cls, color_index: int) -> str:
         """Get color name from color index"""
@@ -95,10 +101,15 @@ class MiiParser:
             >>> mii = MiiParser.parse(mii_data)
             >>> print(mii.name)
         """
-        mii_name = cls._read_mii_name(data)
-        creator_name = cls._read_creator_name(data)
-        metadata = cls._read_mii_metadata(data)
-        mii_id = cls._read_mii_id(data)
+        # One struct call pulls out every fixed-offset field at once
+        if len(data) >= _RECORD_STRUCT.size:
+            flags, name_raw, mii_id, creator_raw = _RECORD_STRUCT.unpack_from(data)
+        else:
+            flags, name_raw, mii_id = _HEADER_STRUCT.unpack_from(data)
+            creator_raw = data[54:74]
+        mii_name = cls._decode_string(name_raw)
+        creator_name = cls._decode_string(creator_raw)
+        metadata = cls._unpack_flags(flags)
         color_name = cls._get_color_name(metadata[3])
 
         return Mii(
@@ -114,3 +125,93 @@ class MiiParser:
             is_favorite=bool(metadata[4]),
             padding=padding,
         )
+
+    @staticmethod
+    def _batch_string_ends(columns) -> list:
+        """Find the byte length of each UTF-16BE string in a batch of fields
+
+        Vectorized equivalent of _decode_string's terminator search: locate
+        the first aligned 0x0000 code unit in every row and cut before it, or
+        keep the full field when there is none.
+        """
+        pairs = (columns[:, ::2] == 0) & (columns[:, 1::2] == 0)
+        ends = numpy.where(pairs.any(axis=1), pairs.argmax(axis=1) * 2, columns.shape[1])
+        return ends.tolist()
+
+    @classmethod
+    def parse_batch(cls, records: Sequence[bytes], padding: int = 0) -> List[Mii]:
+        """Parse a batch of equally-sized raw Mii records
+
+        With NumPy installed, the metadata flags and the UTF-16BE null
+        terminator positions for every record are computed in bulk C
+        operations, leaving only the final string decode per record in
+        Python. Without it, each record goes through parse() as usual.
+
+        Args:
+            records: Raw Mii records, all of the same size
+            padding: Number of padding bytes to append when writing to disk
+
+        Returns:
+            List of Mii dataclass instances, in input order
+        """
+        if numpy is None or len(records) < 2 or len({len(r) for r in records}) > 1:
+            return [cls.parse(record, padding=padding) for record in records]
+
+        arr = numpy.frombuffer(b"".join(records), dtype=numpy.uint8)
+        arr = arr.reshape(len(records), len(records[0]))
+
+        flags = ((arr[:, 0].astype(numpy.uint16) << 8) | arr[:, 1]).tolist()
+        name_ends = cls._batch_string_ends(arr[:, 2:22])
+        creator_ends = cls._batch_string_ends(arr[:, 54:74])
+
+        miis = []
+        for data, value, name_end, creator_end in zip(
+            records, flags, name_ends, creator_ends
+        ):
+            name = data[2 : 2 + name_end].decode("utf-16be").rstrip("\x00")
+            creator = data[54 : 54 + creator_end].decode("utf-16be").rstrip("\x00")
+            birth_month = (value >> 10) & 0xF
+            birth_day = (value >> 5) & 0x1F
+            color_index = (value >> 1) & 0xF
+
+            miis.append(
+                Mii(
+                    raw_data=data,
+                    name=name or "Unnamed",
+                    creator_name=creator or "Unknown",
+                    mii_id=data[24:28],
+                    is_girl=bool((value >> 14) & 0x1),
+                    birth_month=birth_month if birth_month else None,
+                    birth_day=birth_day if birth_day else None,
+                    favorite_color_index=color_index,
+                    favorite_color=cls._get_color_name(color_index),
+                    is_favorite=bool(value & 0x1),
+                    padding=padding,
+                )
+            )
+
+        return miis
+
+    @classmethod
+    def parse_file(cls, path: Path, padding: int = 0) -> Mii:
+        """Parse a .mii file into a Mii dataclass instance, with caching
+
+        Parsed results are cached keyed by path, modification time and file
+        size, so repeated scans of an unchanged file skip the read and decode
+        entirely. Callers should treat the returned Mii as read-only since
+        cache hits share one instance.
+
+        Args:
+            path: Path to the .mii file
+            padding: Number of padding bytes to append when writing to disk
+
+        Returns:
+            Mii dataclass instance
+
+        Examples:
+            >>> from pathlib import Path
+            >>> mii = MiiParser.parse_file(Path("WII_PL00000.mii"))
+            >>> print(mii.name)
+        """
+        stat = path.stat()
+        return _parse_file_cached(str(path), stat.st_mtime_ns, stat.st_size, padding)